@@ -9,12 +9,22 @@ IMPORTANT: Only use this script on websites where you have permission to downloa
 import os
 import sys
 import time
+import random
+import queue
 import threading
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
 from pathlib import Path
 from datetime import datetime
 
+# Playwright is imported once here; the GUI still starts without it and
+# reports the missing dependency when a download is started
+try:
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+except ImportError:
+    sync_playwright = None
+    PlaywrightTimeoutError = Exception
+
 # =============================================================================
 # DOWNLOADER ENGINE (runs in background thread)
 # =============================================================================
@@ -30,41 +40,53 @@ class DownloaderEngine:
         Initialize the downloader engine.
         
         Args:
-            gui_callback: Function to call for logging messages to GUI
+            gui_callback: Function called with (message, level) to log to the GUI
         """
         self.gui_callback = gui_callback
         self.is_running = False
         self.should_stop = False
+        
+        # Statistics, updated concurrently by the worker threads
+        self._stats_lock = threading.Lock()
+        self.successful = 0
+        self.failed = 0
+        self.failed_urls = []
+        
+        # Worker threads as (thread, inbox) pairs, kept alive between runs
+        self._sessions = []
     
     def log(self, message, level="INFO"):
         """Send a log message to the GUI."""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.gui_callback(f"[{timestamp}] {level}: {message}")
+        self.gui_callback(f"[{timestamp}] {level}: {message}", level)
     
     def download_file(self, page, url, download_path, selector, attempt, max_retries, 
-                      page_timeout, download_timeout):
+                      page_timeout, download_timeout, button_timeout):
         """
         Navigate to a URL and click the download button.
-        """
-        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
         
+        download_path is a Path, built once per batch by the caller.
+        button_timeout is how long (ms) the selector may take to match anything
+        before the button is reported as not found.
+        """
         try:
             self.log(f"[Attempt {attempt}/{max_retries + 1}] Opening: {url}")
             
             # Navigate to the page
-            page.goto(url, wait_until="networkidle", timeout=page_timeout)
+            page.goto(url, wait_until="domcontentloaded", timeout=page_timeout)
             self.log("Page loaded successfully")
             
-            # Small delay for dynamic content
-            page.wait_for_timeout(1000)
-            
-            # Check if download button exists
+            # Wait for the button itself rather than for the network to go idle
             download_button = page.locator(selector)
-            
-            if download_button.count() == 0:
+            try:
+                download_button.first.wait_for(state="attached", timeout=button_timeout)
+            except PlaywrightTimeoutError:
                 self.log(f"Download button not found: {selector}", "WARNING")
                 return False
             
+            # The button exists; give it the full page timeout to become visible
+            download_button.first.wait_for(state="visible", timeout=page_timeout)
+            
             self.log("Found download button, initiating download...")
             
             # Use Playwright's download handling
@@ -76,16 +98,22 @@ class DownloaderEngine:
             self.log(f"Downloading: {filename}")
             
             # Save the file
-            save_path = os.path.join(download_path, filename)
-            download.save_as(save_path)
+            save_path = download_path / filename
+            try:
+                # Rename Playwright's temp file into place instead of copying it
+                os.replace(download.path(), save_path)
+            except OSError:
+                # Different filesystem (or file in use) - fall back to a copy
+                download.save_as(save_path)
             
-            if os.path.exists(save_path):
-                file_size = os.path.getsize(save_path)
-                self.log(f"✓ Complete: {filename} ({file_size:,} bytes)", "SUCCESS")
-                return True
-            else:
+            try:
+                file_size = os.stat(save_path).st_size
+            except FileNotFoundError:
                 self.log(f"✗ File not saved: {filename}", "ERROR")
                 return False
+            
+            self.log(f"✓ Complete: {filename} ({file_size:,} bytes)", "SUCCESS")
+            return True
                 
         except PlaywrightTimeoutError as e:
             self.log(f"✗ Timeout: {str(e)}", "ERROR")
@@ -94,6 +122,246 @@ class DownloaderEngine:
             self.log(f"✗ Error: {str(e)}", "ERROR")
             return False
     
+    def launch_context(self, playwright, profile_dir, browser_type, custom_browser_path, headless,
+                       slow_mo=0):
+        """
+        Launch the configured browser engine with a persistent profile.
+        
+        The profile keeps the HTTP cache, service workers and cookies warm
+        between URLs and between runs, so repeat visits to the same site
+        skip re-downloading static assets and re-authenticating.
+        
+        Args:
+            playwright: Running Playwright instance owned by the calling thread
+            profile_dir: Browser profile (user data) directory
+            browser_type: "Chromium", "Firefox", "WebKit" or "Custom"
+            custom_browser_path: Optional path to a browser executable
+            headless: Whether to hide the browser window
+            slow_mo: Delay in ms inserted before every browser action (debugging only)
+        """
+        # Select browser engine and configure launch options
+        launch_options = {
+            'accept_downloads': True,
+            'headless': headless
+        }
+        
+        if slow_mo:
+            launch_options['slow_mo'] = slow_mo
+        
+        # Add custom executable path if provided
+        if custom_browser_path and os.path.exists(custom_browser_path):
+            launch_options['executable_path'] = custom_browser_path
+        
+        # Launch the appropriate browser
+        if browser_type == "Firefox" or (custom_browser_path and "zen" in custom_browser_path.lower()):
+            engine = playwright.firefox
+        elif browser_type == "WebKit":
+            engine = playwright.webkit
+        else:
+            engine = playwright.chromium
+        
+        return engine.launch_persistent_context(user_data_dir=str(profile_dir), **launch_options)
+    
+    def _interruptible_sleep(self, seconds):
+        """Sleep in short slices so a stop request takes effect within ~100 ms."""
+        end = time.monotonic() + seconds
+        while not self.should_stop:
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(0.1, remaining))
+    
+    def process_urls(self, context, url_queue, total, settings):
+        """
+        Process URLs from the shared queue until it is empty or a stop is requested.
+        
+        Args:
+            context: Browser context owned by the calling worker thread
+            url_queue: Queue of (index, url) tuples shared by all workers
+            total: Total number of URLs in the batch (for progress messages)
+            settings: Dictionary of settings from GUI
+        """
+        # Extract settings (loop invariants for the whole batch)
+        download_path = Path(settings['download_folder'])
+        selector = settings['selector']
+        max_retries = settings['max_retries']
+        delay = settings['delay']
+        max_delay_cap = settings['max_delay_cap']
+        page_timeout = settings['page_timeout'] * 1000  # Convert to ms
+        download_timeout = settings['download_timeout'] * 1000
+        button_timeout = settings['button_timeout'] * 1000
+        
+        while not self.should_stop:
+            try:
+                index, url = url_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            self.log("-" * 40)
+            self.log(f"Processing URL {index}/{total}")
+            
+            # Fresh page per URL so one heavy page can't slow down the rest of the batch;
+            # the context (cookies, cache) is shared
+            success = False
+            page = None
+            try:
+                page = context.new_page()
+                
+                # Try download with retries
+                for attempt in range(1, max_retries + 2):
+                    if self.should_stop:
+                        break
+                    
+                    success = self.download_file(
+                        page, url, download_path, selector, 
+                        attempt, max_retries, page_timeout, download_timeout,
+                        button_timeout
+                    )
+                    
+                    if success:
+                        break
+                    
+                    if attempt <= max_retries:
+                        # Exponential backoff with jitter so parallel workers don't retry in lockstep
+                        sleep_for = min(delay * (2 ** (attempt - 1)), max_delay_cap)
+                        sleep_for += random.uniform(0, 0.25 * sleep_for)
+                        self.log(f"Retrying in {sleep_for:.1f} seconds...")
+                        self._interruptible_sleep(sleep_for)
+            except Exception as e:
+                # e.g. the user closed the browser window; the URL still counts as failed
+                self.log(f"✗ Error: {str(e)}", "ERROR")
+            finally:
+                if page is not None:
+                    try:
+                        page.close()
+                    except Exception:
+                        pass
+            
+            with self._stats_lock:
+                if success:
+                    self.successful += 1
+                else:
+                    self.failed += 1
+                    self.failed_urls.append(url)
+            
+            # Delay between downloads
+            if not url_queue.empty() and not self.should_stop:
+                self.log(f"Waiting {delay} seconds...")
+                self._interruptible_sleep(delay)
+    
+    def _session_loop(self, worker_id, inbox):
+        """
+        Body of a long-lived worker thread.
+        
+        Playwright's sync API is bound to the thread that started it, so each
+        worker owns its own Playwright instance and persistent browser context
+        and keeps them alive between runs until shutdown() is called. A profile
+        directory can only be opened by one browser at a time, so each worker
+        gets its own subfolder of the profile directory.
+        
+        Args:
+            worker_id: Index of this worker, used to pick its profile folder
+            inbox: Queue of batches to process; None ends the loop
+        """
+        playwright = None
+        context = None
+        launch_key = None
+        
+        while True:
+            job = inbox.get()
+            if job is None:
+                break
+            
+            url_queue, total, settings, done = job
+            try:
+                if playwright is None:
+                    playwright = sync_playwright().start()
+                
+                profile_dir = Path(settings['persistent_profile_dir']) / f"worker-{worker_id}"
+                key = (profile_dir, settings['browser_type'], settings['custom_browser_path'],
+                       settings['headless'], settings['slow_mo'])
+                
+                # Relaunch if the launch settings changed since the last run
+                if context is not None and key != launch_key:
+                    self._close_context(context)
+                    context = None
+                
+                # Cheap round-trip that fails if the user closed the browser between runs
+                if context is not None:
+                    try:
+                        context.unroute("**/*")
+                    except Exception:
+                        context = None
+                
+                if context is None:
+                    self.log("Launching browser...")
+                    context = self.launch_context(
+                        playwright, profile_dir, settings['browser_type'],
+                        settings['custom_browser_path'], settings['headless'],
+                        settings['slow_mo']
+                    )
+                    launch_key = key
+                
+                # Fast mode: skip resources the download button doesn't need. Trade-off:
+                # routing disables the browser's HTTP cache (so the warm profile cache
+                # is not used) and sends every request through this worker thread.
+                blocked_types = set()
+                if settings['block_resources']:
+                    blocked_types.update({"image", "font", "media"})
+                if settings['block_stylesheets']:
+                    blocked_types.add("stylesheet")
+                if blocked_types:
+                    context.route("**/*", lambda route: route.abort()
+                                  if route.request.resource_type in blocked_types
+                                  else route.continue_())
+                
+                try:
+                    self.process_urls(context, url_queue, total, settings)
+                finally:
+                    # Remove the route now: between runs this thread is blocked on its
+                    # inbox and could not answer intercepted requests from an open window
+                    if blocked_types:
+                        try:
+                            context.unroute("**/*")
+                        except Exception:
+                            pass
+            except Exception as e:
+                self.log(f"Browser error: {str(e)}", "ERROR")
+            finally:
+                done.set()
+        
+        # Shutdown requested
+        if context is not None:
+            self._close_context(context)
+        if playwright is not None:
+            playwright.stop()
+    
+    def _close_context(self, context):
+        """Close a browser context, ignoring errors if it is already gone."""
+        try:
+            context.close()
+        except Exception:
+            pass
+    
+    def _ensure_sessions(self, count):
+        """Start or retire worker threads so exactly `count` are alive."""
+        # Retire workers beyond the requested count
+        while len(self._sessions) > count:
+            thread, inbox = self._sessions.pop()
+            inbox.put(None)
+            thread.join()
+        
+        while len(self._sessions) < count:
+            worker_id = len(self._sessions) + 1
+            inbox = queue.Queue()
+            thread = threading.Thread(
+                target=self._session_loop,
+                args=(worker_id, inbox),
+                daemon=True
+            )
+            thread.start()
+            self._sessions.append((thread, inbox))
+    
     def run(self, urls, settings):
         """
         Main download loop.
@@ -102,29 +370,27 @@ class DownloaderEngine:
             urls: List of URLs to process
             settings: Dictionary of settings from GUI
         """
-        from playwright.sync_api import sync_playwright
-        
         self.is_running = True
         self.should_stop = False
         
         # Extract settings
         download_path = settings['download_folder']
         selector = settings['selector']
-        max_retries = settings['max_retries']
-        delay = settings['delay']
-        headless = settings['headless']
-        page_timeout = settings['page_timeout'] * 1000  # Convert to ms
-        download_timeout = settings['download_timeout'] * 1000
         browser_type = settings['browser_type']
         custom_browser_path = settings['custom_browser_path']
+        workers = max(1, min(settings['workers'], len(urls)))
+        
+        # Browser profile lives next to the downloads unless overridden
+        if not settings.get('persistent_profile_dir'):
+            settings = dict(settings, persistent_profile_dir=os.path.join(download_path, ".browser_profile"))
         
         # Create download folder
         Path(download_path).mkdir(parents=True, exist_ok=True)
         
-        # Statistics
-        successful = 0
-        failed = 0
-        failed_urls = []
+        # Statistics (shared between workers)
+        self.successful = 0
+        self.failed = 0
+        self.failed_urls = []
         
         self.log("=" * 50)
         self.log("Starting downloads...")
@@ -132,99 +398,88 @@ class DownloaderEngine:
         self.log(f"Download folder: {download_path}")
         self.log(f"Button selector: {selector}")
         self.log(f"Browser: {browser_type}" + (f" ({custom_browser_path})" if custom_browser_path else ""))
+        self.log(f"Parallel workers: {workers}")
+        self.log(f"Browser profile: {settings['persistent_profile_dir']}")
         self.log("=" * 50)
         
-        try:
-            with sync_playwright() as playwright:
-                self.log("Launching browser...")
-                
-                # Select browser engine and configure launch options
-                launch_options = {
-                    'headless': headless,
-                    'slow_mo': 100
-                }
-                
-                # Add custom executable path if provided
-                if custom_browser_path and os.path.exists(custom_browser_path):
-                    launch_options['executable_path'] = custom_browser_path
-                    self.log(f"Using custom browser: {custom_browser_path}")
-                
-                # Launch the appropriate browser
-                if browser_type == "Firefox" or (custom_browser_path and "zen" in custom_browser_path.lower()):
-                    browser = playwright.firefox.launch(**launch_options)
-                elif browser_type == "WebKit":
-                    browser = playwright.webkit.launch(**launch_options)
-                else:
-                    browser = playwright.chromium.launch(**launch_options)
-                
-                context = browser.new_context(accept_downloads=True)
-                page = context.new_page()
-                
-                for index, url in enumerate(urls, start=1):
-                    # Check if user requested stop
-                    if self.should_stop:
-                        self.log("Download stopped by user", "WARNING")
-                        break
-                    
-                    self.log("-" * 40)
-                    self.log(f"Processing URL {index}/{len(urls)}")
-                    
-                    # Try download with retries
-                    success = False
-                    for attempt in range(1, max_retries + 2):
-                        if self.should_stop:
-                            break
-                        
-                        success = self.download_file(
-                            page, url, download_path, selector, 
-                            attempt, max_retries, page_timeout, download_timeout
-                        )
-                        
-                        if success:
-                            break
-                        
-                        if attempt <= max_retries:
-                            self.log(f"Retrying in {delay} seconds...")
-                            time.sleep(delay)
-                    
-                    if success:
-                        successful += 1
-                    else:
-                        failed += 1
-                        failed_urls.append(url)
-                    
-                    # Delay between downloads
-                    if index < len(urls) and not self.should_stop:
-                        self.log(f"Waiting {delay} seconds...")
-                        time.sleep(delay)
-                
-                self.log("Closing browser...")
-                context.close()
-                browser.close()
+        if custom_browser_path and os.path.exists(custom_browser_path):
+            self.log(f"Using custom browser: {custom_browser_path}")
         
-        except Exception as e:
-            self.log(f"Browser error: {str(e)}", "ERROR")
+        url_queue = queue.Queue()
+        for index, url in enumerate(urls, start=1):
+            url_queue.put((index, url))
+        
+        # Keep one browser per configured worker alive, even if this batch is smaller
+        self._ensure_sessions(max(1, settings['workers']))
+        
+        done_events = []
+        for thread, inbox in self._sessions[:workers]:
+            done = threading.Event()
+            inbox.put((url_queue, len(urls), settings, done))
+            done_events.append(done)
+        
+        for done in done_events:
+            done.wait()
+        
+        # URLs no worker picked up: skipped after Stop, failed if a browser couldn't launch
+        skipped_urls = []
+        while True:
+            try:
+                index, url = url_queue.get_nowait()
+            except queue.Empty:
+                break
+            if self.should_stop:
+                skipped_urls.append(url)
+            else:
+                self.failed += 1
+                self.failed_urls.append(url)
+        
+        if self.should_stop:
+            self.log("Download stopped by user", "WARNING")
         
         # Summary
         self.log("=" * 50)
         self.log("DOWNLOAD SUMMARY")
         self.log("=" * 50)
-        self.log(f"Total: {len(urls)} | Success: {successful} | Failed: {failed}")
+        self.log(f"Total: {len(urls)} | Success: {self.successful} | Failed: {self.failed}"
+                 + (f" | Not attempted: {len(skipped_urls)}" if skipped_urls else ""))
         
-        if failed_urls:
+        if self.failed_urls:
             self.log("Failed URLs:")
-            for url in failed_urls:
+            for url in self.failed_urls:
+                self.log(f"  - {url}")
+        
+        if skipped_urls:
+            self.log("Not attempted (stopped):")
+            for url in skipped_urls:
                 self.log(f"  - {url}")
         
         self.log("=" * 50)
         self.log("Done!")
         
         self.is_running = False
-        return successful, failed
+        return self.successful, self.failed
     
     def stop(self):
         """Request the download loop to stop."""
         self.should_stop = True
+    
+    def shutdown(self):
+        """
+        Close every worker's browser and Playwright instance.
+        
+        Idle workers are closed in an orderly way. Workers still busy with a
+        download are not waited for: they are daemon threads and end with the
+        process, so quitting mid-run doesn't hang without a window.
+        """
+        self.should_stop = True
+        if not self.is_running:
+            self._ensure_sessions(0)
+            return
+        
+        sessions, self._sessions = self._sessions, []
+        for thread, inbox in sessions:
+            inbox.put(None)
 
 
 # =============================================================================
@@ -236,6 +491,13 @@ class DownloaderGUI:
     Main GUI application class.
     """
     
+    # Log output is flushed to the Text widget in batches on this interval
+    LOG_FLUSH_INTERVAL_MS = 100
+    LOG_FLUSH_BATCH_SIZE = 200
+    
+    # Only the most recent lines are kept in the log output
+    MAX_LOG_LINES = 5000
+    
     def __init__(self):
         """Initialize the GUI."""
         self.root = tk.Tk()
@@ -253,12 +515,22 @@ class DownloaderGUI:
         self.engine = DownloaderEngine(self.log_message)
         self.download_thread = None
         
+        # Log messages from any thread are queued and flushed on the main thread
+        self.log_queue = queue.Queue()
+        
+        # Pending URL count refresh and hash of the last counted text
+        self._url_count_after = None
+        self._last_url_hash = None
+        
         # Build the GUI
         self.create_widgets()
         self.load_settings()
         
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # Start flushing queued log messages
+        self.root.after(self.LOG_FLUSH_INTERVAL_MS, self._drain_log_queue)
     
     def create_widgets(self):
         """Create all GUI widgets."""
@@ -293,7 +565,7 @@ class DownloaderGUI:
         ttk.Label(url_btn_frame, textvariable=self.url_count_var).pack(side=tk.RIGHT)
         
         # Bind text change event
-        self.url_text.bind('<KeyRelease>', self.update_url_count)
+        self.url_text.bind('<KeyRelease>', self._schedule_url_count)
         
         # =====================================================================
         # SETTINGS SECTION
@@ -352,6 +624,23 @@ class DownloaderGUI:
         self.download_timeout_var = tk.IntVar(value=60)
         ttk.Spinbox(row3, from_=30, to=300, width=5, textvariable=self.download_timeout_var).pack(side=tk.LEFT, padx=5)
         
+        # Row 3b: Concurrency
+        row3b = ttk.Frame(settings_frame)
+        row3b.pack(fill=tk.X, pady=2)
+        
+        ttk.Label(row3b, text="Parallel Workers:", width=15).pack(side=tk.LEFT)
+        self.workers_var = tk.IntVar(value=1)
+        ttk.Spinbox(row3b, from_=1, to=16, width=5, textvariable=self.workers_var).pack(side=tk.LEFT, padx=5)
+        
+        ttk.Label(row3b, text="Max Retry Backoff (sec):").pack(side=tk.LEFT, padx=(20, 0))
+        self.max_delay_cap_var = tk.IntVar(value=30)
+        ttk.Spinbox(row3b, from_=1, to=300, width=5, textvariable=self.max_delay_cap_var).pack(side=tk.LEFT, padx=5)
+        
+        # Lower this to fail fast on a wrong selector; raise it for sites that add the button late
+        ttk.Label(row3b, text="Button Timeout:").pack(side=tk.LEFT, padx=(20, 0))
+        self.button_timeout_var = tk.IntVar(value=30)
+        ttk.Spinbox(row3b, from_=1, to=120, width=5, textvariable=self.button_timeout_var).pack(side=tk.LEFT, padx=5)
+        
         # Row 4: Checkboxes
         row4 = ttk.Frame(settings_frame)
         row4.pack(fill=tk.X, pady=2)
@@ -360,6 +649,20 @@ class DownloaderGUI:
         ttk.Checkbutton(row4, text="Headless Mode (hide browser)", 
                         variable=self.headless_var).pack(side=tk.LEFT)
         
+        self.slow_mode_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(row4, text="Slow mode (debug)", 
+                        variable=self.slow_mode_var).pack(side=tk.LEFT, padx=(20, 0))
+        
+        # Off by default: blocking needs request routing, which disables the HTTP cache
+        self.block_resources_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(row4, text="Fast mode (block images/fonts)", 
+                        variable=self.block_resources_var).pack(side=tk.LEFT, padx=(20, 0))
+        
+        # Kept separate: some sites hide the button until their CSS loads
+        self.block_stylesheets_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(row4, text="Block stylesheets", 
+                        variable=self.block_stylesheets_var).pack(side=tk.LEFT, padx=(20, 0))
+        
         # =====================================================================
         # BROWSER SELECTION SECTION
         # =====================================================================
@@ -456,35 +759,68 @@ class DownloaderGUI:
         if links_file.exists():
             self.load_urls_from_file(str(links_file))
     
-    def log_message(self, message):
+    def log_message(self, message, level="INFO"):
         """
         Add a message to the log output.
         Thread-safe - can be called from any thread.
+        
+        Args:
+            message: Text to append
+            level: "INFO", "SUCCESS", "WARNING" or "ERROR"; selects the text color
+        """
+        self.log_queue.put((message, level))
+    
+    def _drain_log_queue(self):
+        """
+        Flush queued log messages into the log output.
+        Runs periodically on the main thread.
         """
-        def update():
+        # Collect pending messages, grouping consecutive lines with the same tag
+        groups = []
+        for _ in range(self.LOG_FLUSH_BATCH_SIZE):
+            try:
+                message, tag = self.log_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if groups and groups[-1][0] == tag:
+                groups[-1][1].append(message)
+            else:
+                groups.append((tag, [message]))
+        
+        if groups:
             self.log_text.config(state=tk.NORMAL)
+            for tag, lines in groups:
+                self.log_text.insert(tk.END, "\n".join(lines) + "\n", tag)
             
-            # Determine tag based on message content
-            tag = "INFO"
-            if "SUCCESS" in message or "✓" in message:
-                tag = "SUCCESS"
-            elif "ERROR" in message or "✗" in message:
-                tag = "ERROR"
-            elif "WARNING" in message:
-                tag = "WARNING"
+            # Trim the oldest lines so long runs don't grow the widget without bound
+            line_count = int(self.log_text.index("end-1c").split(".")[0])
+            if line_count > self.MAX_LOG_LINES:
+                self.log_text.delete("1.0", f"{line_count - self.MAX_LOG_LINES}.0")
             
-            self.log_text.insert(tk.END, message + "\n", tag)
             self.log_text.see(tk.END)  # Auto-scroll to bottom
             self.log_text.config(state=tk.DISABLED)
         
-        # Schedule update on main thread
-        self.root.after(0, update)
+        self.root.after(self.LOG_FLUSH_INTERVAL_MS, self._drain_log_queue)
+    
+    def _schedule_url_count(self, event=None):
+        """Refresh the URL count once typing pauses, instead of on every keystroke."""
+        if self._url_count_after is not None:
+            self.root.after_cancel(self._url_count_after)
+        self._url_count_after = self.root.after(200, self.update_url_count)
     
     def update_url_count(self, event=None):
         """Update the URL count label."""
+        self._url_count_after = None
         text = self.url_text.get(1.0, tk.END).strip()
-        urls = [url.strip() for url in text.split('\n') if url.strip() and not url.strip().startswith('#')]
-        self.url_count_var.set(f"{len(urls)} URLs")
+        
+        # Skip re-parsing if the text hasn't changed (e.g. arrow keys)
+        text_hash = hash(text)
+        if text_hash == self._last_url_hash:
+            return
+        self._last_url_hash = text_hash
+        
+        self.url_count_var.set(f"{len(self.get_urls())} URLs")
     
     def browse_folder(self):
         """Open folder browser dialog."""
@@ -536,11 +872,13 @@ class DownloaderGUI:
             messagebox.showinfo("Info", "Download folder doesn't exist yet.")
     
     def get_urls(self):
-        """Get list of URLs from the text area."""
-        text = self.url_text.get(1.0, tk.END).strip()
-        urls = [url.strip() for url in text.split('\n') 
-                if url.strip() and not url.strip().startswith('#')]
-        return urls
+        """Get list of unique URLs from the text area, in their original order."""
+        urls = {}
+        for line in self.url_text.get(1.0, tk.END).splitlines():
+            url = line.strip()
+            if url and url[0] != '#':
+                urls[url] = None
+        return list(urls)
     
     def get_settings(self):
         """Get current settings as a dictionary."""
@@ -549,11 +887,17 @@ class DownloaderGUI:
             'selector': self.selector_var.get(),
             'max_retries': self.retries_var.get(),
             'delay': self.delay_var.get(),
+            'max_delay_cap': self.max_delay_cap_var.get(),
             'headless': self.headless_var.get(),
+            'slow_mo': 100 if self.slow_mode_var.get() else 0,
+            'block_resources': self.block_resources_var.get(),
+            'block_stylesheets': self.block_stylesheets_var.get(),
             'page_timeout': self.page_timeout_var.get(),
+            'button_timeout': self.button_timeout_var.get(),
             'download_timeout': self.download_timeout_var.get(),
             'browser_type': self.browser_type_var.get(),
             'custom_browser_path': self.browser_path_var.get().strip(),
+            'workers': self.workers_var.get(),
         }
     
     def start_download(self):
@@ -573,9 +917,7 @@ class DownloaderGUI:
             return
         
         # Check if Playwright is installed
-        try:
-            import playwright
-        except ImportError:
+        if sync_playwright is None:
             messagebox.showerror("Error", 
                 "Playwright is not installed.\n\n"
                 "Run these commands:\n"
@@ -602,7 +944,7 @@ class DownloaderGUI:
         try:
             self.engine.run(urls, settings)
         except Exception as e:
-            self.log_message(f"Error: {str(e)}")
+            self.log_message(f"Error: {str(e)}", "ERROR")
         finally:
             # Update UI on completion (schedule on main thread)
             self.root.after(0, self.download_complete)
@@ -622,11 +964,14 @@ class DownloaderGUI:
     def on_closing(self):
         """Handle window close event."""
         if self.engine.is_running:
-            if messagebox.askokcancel("Quit", "Download in progress. Stop and quit?"):
-                self.engine.stop()
-                self.root.destroy()
-        else:
-            self.root.destroy()
+            if not messagebox.askokcancel("Quit", "Download in progress. Stop and quit?"):
+                return
+            self.engine.stop()
+        
+        self.root.destroy()
+        
+        # Close the browsers kept open between runs
+        self.engine.shutdown()
     
     def on_browser_type_change(self, event=None):
         """Handle browser type selection change."""